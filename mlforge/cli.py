@@ -0,0 +1,166 @@
+"""
+Command line utilities for mlforge.
+
+The `precompile` command turns a YAML pipeline definition into a plain
+Python module that builds the equivalent ``list[Stage]`` directly, so
+applications that load the same pipeline on every start can skip both the
+YAML parse and `_process_config` entirely::
+
+    python -m mlforge.cli precompile pipeline.yaml --module my_package.stages
+
+    # then, in the application:
+    from pipeline_compiled import build
+    pipeline = Pipeline(host)
+    pipeline.pipeline = build()
+
+(C) J. Renero, 2024
+"""
+
+import argparse
+import ast
+import os
+import sys
+
+from mlforge.mlforge import _get_yaml_loader
+
+_HEADER = '''"""
+Pipeline stages precompiled from '{source}'.
+
+Generated by `python -m mlforge.cli precompile` -- do not edit by hand;
+regenerate after changing the YAML definition.
+"""
+
+from mlforge.mlforge import Stage
+{module_import}
+
+def build():
+    """Return the precompiled pipeline as a list of Stage objects."""
+    return [
+'''
+
+_FOOTER = '''    ]
+'''
+
+# Configuration keys mapped to the Stage field they populate; mirrors
+# Pipeline._STAGE_SETTERS.
+_FIELD_FOR_KEY = {
+    'attribute': 'attribute_name',
+    'method': 'method_name',
+    'class': 'class_name',
+    'arguments': 'arguments',
+}
+
+
+def _literal(step_id, key, value):
+    """
+    Render a value as a Python literal expression, refusing values whose
+    repr would not evaluate back in the generated module (e.g. YAML dates,
+    which safe-load as datetime.date objects).
+    """
+    rendered = repr(value)
+    try:
+        ast.literal_eval(rendered)
+    except (ValueError, SyntaxError):
+        raise ValueError(
+            f"Step '{step_id}': value {rendered} for '{key}' cannot be "
+            f"emitted as a Python literal") from None
+    return rendered
+
+
+def _compile_stage(num, step_id, step_contents):
+    """
+    Render one configuration step as a literal Stage(...) constructor line.
+    """
+    parts = [f"_num={num}", f"_id={_literal(step_id, 'id', step_id)}"]
+    for key, value in step_contents.items():
+        field = _FIELD_FOR_KEY.get(key)
+        if field is None:
+            raise ValueError(f"Key '{key}' not recognized in the configuration")
+        if key == 'class':
+            # Resolved at import time of the generated module, against the
+            # module given with --module (same role as the caller module
+            # in `from_config`).
+            parts.append(f"class_name=getattr(_module, {value!r})")
+        else:
+            parts.append(f"{field}={_literal(step_id, key, value)}")
+    return f"        Stage({', '.join(parts)}),\n"
+
+
+def precompile(config_filename: str, output: str = None, module: str = None):
+    """
+    Compile a YAML pipeline definition into a Python module.
+
+    Parameters
+    ----------
+    config_filename: str
+        Path to the YAML file with the pipeline definition.
+    output: str
+        Path of the module to write. Defaults to '<stem>_compiled.py' next
+        to the YAML file.
+    module: str
+        Dotted name of the module against which 'class' entries are
+        resolved. Required when the configuration references classes.
+
+    Returns
+    -------
+    output: str
+        The path of the generated module.
+    """
+    import yaml
+
+    with open(config_filename, 'r', encoding='utf-8') as f:
+        config = yaml.load(f, Loader=_get_yaml_loader())
+
+    has_classes = any('class' in contents for contents in config.values())
+    if has_classes and module is None:
+        raise ValueError(
+            "The configuration references classes: pass --module with the "
+            "module that defines them")
+
+    if output is None:
+        stem, _ = os.path.splitext(config_filename)
+        output = stem + "_compiled.py"
+
+    module_import = ""
+    if has_classes:
+        module_import = (f"from importlib import import_module\n\n"
+                         f"_module = import_module({module!r})\n")
+
+    with open(output, 'w', encoding='utf-8') as f:
+        f.write(_HEADER.format(
+            source=os.path.basename(config_filename),
+            module_import=module_import))
+        for num, (step_id, step_contents) in enumerate(config.items()):
+            f.write(_compile_stage(num, step_id, step_contents))
+        f.write(_FOOTER)
+
+    return output
+
+
+def main(argv=None):
+    """Entry point of the `mlforge.cli` command line tool."""
+    parser = argparse.ArgumentParser(
+        prog="mlforge.cli", description="mlforge command line utilities")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    pre = subparsers.add_parser(
+        "precompile",
+        help="compile a YAML pipeline definition into a Python module")
+    pre.add_argument("config", help="path to the YAML pipeline definition")
+    pre.add_argument(
+        "-o", "--output", default=None,
+        help="module to write (default: '<stem>_compiled.py')")
+    pre.add_argument(
+        "-m", "--module", default=None,
+        help="module against which 'class' entries are resolved")
+
+    args = parser.parse_args(argv)
+    if args.command == "precompile":
+        output = precompile(args.config, args.output, args.module)
+        print(f"Wrote {output}")
+        return 0
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
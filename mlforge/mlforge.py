@@ -13,27 +13,247 @@ Pipeline class to define and run several execution steps.
 # pylint: disable=W0106:expression-not-assigned, R1702:too-many-branches
 # pylint: disable=W0212:protected-access
 
+from __future__ import annotations
+
+import functools
+import hashlib
 import importlib
 import inspect
+import itertools
+import json
 import logging
+import os
+import re
+import sys
 import time
 import types
-import typing
-from dataclasses import asdict, dataclass
+import weakref
+from collections import ChainMap
+from dataclasses import dataclass, fields
 from importlib import import_module
-from random import getrandbits
-from typing import Any, Callable, List, Union
+from typing import ClassVar
 
-import yaml
-from rich import print as rp
-from rich.columns import Columns
-from rich.table import Table
+# yaml, rich and the rich-based progress bar are imported lazily at their
+# call sites: many pipelines never load a config file nor render anything,
+# and deferring those imports keeps module import time low.
 
 from mlforge.logconfig import LogConfig
-from mlforge.progbar import ProgBar
 
+# Optional compiled executor for the parameter-binding plans. The extension
+# is not part of the pure-Python distribution; when an mlforge._plan_native
+# module built against the same opcodes is installed, it takes over the hot
+# loop in `_exec_param_plan`.
+try:
+    from mlforge._plan_native import execute_plan as _execute_plan_native
+except ImportError:
+    _execute_plan_native = None
+
+
+@functools.lru_cache(maxsize=32)
+def _get_module(name: str):
+    """
+    Memoized import_module: repeated config loads resolve their caller
+    module without re-acquiring the import machinery locks.
+    """
+    return importlib.import_module(name)
+
+
+def _get_yaml_loader():
+    """
+    Return the YAML loader class to use: LibYAML's C loader when the wheel
+    ships it, the pure-Python SafeLoader otherwise.
+    """
+    import yaml
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _cache_path(config_filename: str) -> str:
+    """
+    Return the name of the sidecar file holding the JSON stage cache of a
+    YAML configuration file.
+    """
+    return config_filename + ".pipeline.cache.json"
+
+
+def _config_digest(config_filename: str) -> str:
+    """
+    Return a short content hash of a configuration file, used to detect
+    whether a stage cache is still valid.
+    """
+    with open(config_filename, 'rb') as file:
+        return hashlib.blake2b(file.read(), digest_size=8).hexdigest()
+
+
+def _thaw(node):
+    """
+    Inverse of `_deep_freeze` for serialization: mapping proxies become
+    dicts and tuples become lists, so the result is JSON-encodable.
+    """
+    if isinstance(node, (dict, types.MappingProxyType)):
+        return {key: _thaw(value) for key, value in node.items()}
+    if isinstance(node, (list, tuple)):
+        return [_thaw(value) for value in node]
+    return node
+
+
+def _has_non_string_keys(node) -> bool:
+    """
+    Return whether any mapping inside the node uses non-string keys.
+    json.dumps stringifies such keys silently, so arguments containing
+    them cannot round-trip through the stage cache.
+    """
+    if isinstance(node, (dict, types.MappingProxyType)):
+        return any(
+            not isinstance(key, str) or _has_non_string_keys(value)
+            for key, value in node.items())
+    if isinstance(node, (list, tuple)):
+        return any(_has_non_string_keys(value) for value in node)
+    return False
+
+
+def _deep_freeze(node):
+    """
+    Return a read-only copy of a parsed config: dicts become mapping proxies
+    and lists become tuples, so cached configs cannot be mutated by callers.
+    """
+    if isinstance(node, dict):
+        return types.MappingProxyType(
+            {key: _deep_freeze(value) for key, value in node.items()})
+    if isinstance(node, list):
+        return tuple(_deep_freeze(value) for value in node)
+    return node
+
+
+# Module globals, captured once so hot paths do not call globals() per lookup.
+_G = globals()
 
-@dataclass
+# Sentinel distinguishing "name not in scope" from names bound to None.
+_MISSING = object()
+
+# Monotonic counter behind stage ids: a process-unique debug identifier does
+# not need random bits, and incrementing an int is far cheaper than the RNG.
+_stage_counter = itertools.count()
+
+# (scale, format) pairs used by `duration`, indexed by (duration < 1), so
+# picking seconds vs milliseconds is a table lookup instead of a branch.
+_DUR_FMT = ((1.0, "{:.2f} s"), (1000.0, "{:.03f} ms"))
+
+# Full per-stage line templates of `duration`, hoisted so the loop reuses
+# one interned template instead of rebuilding an f-string each iteration.
+_STAGE_DUR_FMT = (
+    (1.0, "Stage #{num:>03d} ({id}): {v:.2f} s"),
+    (1000.0, "Stage #{num:>03d} ({id}): {v:.03f} ms"),
+)
+
+# Decorations stripped from log messages in `_m`, in one regex pass.
+_M_STRIP = re.compile(r'  |> |\n')
+
+# Internal Stage fields that `show` leaves out of the stage cards.
+_SHOW_SKIP = frozenset({
+    '_num', '_id', '_method_call', '_parameters', '_timestamp_start',
+    '_timestamp_end', '_duration', '_param_plan'})
+
+# Opcodes of the parameter-binding plan built by `_compile_param_plan`.
+_OP_LITERAL = 0     # use the recorded argument value as-is
+_OP_DYNAMIC = 1     # string argument, resolved against objects_/host at run
+_OP_SCOPE = 2       # no argument given: host attribute, globals or default
+
+
+def _noop(*args, **kwargs):
+    """Do-nothing stand-in bound in place of disabled per-step callbacks."""
+
+
+def _step_tag(element) -> str:
+    """
+    Single-character type tag ('s'tring, 't'ype, 'd'ict) used to key the
+    `_parse_step` dispatch table.
+    """
+    # Exact type tests beat isinstance for the built-in leaf types; classes
+    # still need isinstance, since metaclasses subclass `type`.
+    t = type(element)
+    if t is str:
+        return 's'
+    if t is dict:
+        return 'd'
+    if isinstance(element, type):
+        return 't'
+    return '?'
+
+# Cache of signature introspections, keyed weakly by the callable so entries
+# disappear together with the functions they describe.
+_SIG_CACHE = weakref.WeakKeyDictionary()
+
+
+class _Sig(dict):
+    """
+    A method signature as a dict of parameter name to default value.
+    Subclassing dict keeps the mapping interface (and dict equality) intact
+    while `names` and `defaults` expose the same data as index-aligned
+    tuples, letting hot loops walk the signature without per-item hashing.
+    Both tuples are materialized on first access, after any 'self' pruning
+    by the callers.
+    """
+    __slots__ = ('_names', '_defaults')
+
+    @property
+    def names(self) -> tuple:
+        try:
+            return self._names
+        except AttributeError:
+            self._names = tuple(self)
+            return self._names
+
+    @property
+    def defaults(self) -> tuple:
+        try:
+            return self._defaults
+        except AttributeError:
+            self._defaults = tuple(self.values())
+            return self._defaults
+
+
+def _signature_items(method_call: callable) -> tuple:
+    """
+    Return the parameters of a callable as a tuple of (name, default) pairs.
+    `inspect.signature` is expensive, so each unique callable is introspected
+    only once per process.
+    """
+    # Bound methods are ephemeral wrappers: getattr(host, name) builds a
+    # fresh one each time, so cache against the underlying function. The
+    # callers discard 'self' from the result, making the entry shareable
+    # between the bound and plain forms of the same function.
+    key = getattr(method_call, '__func__', method_call)
+    try:
+        return _SIG_CACHE[key]
+    except (KeyError, TypeError):
+        pass
+
+    parameters = inspect.signature(key).parameters
+    items = tuple(
+        (name, parameter.default) for name, parameter in parameters.items())
+    try:
+        _SIG_CACHE[key] = items
+    except TypeError:
+        # Callables that do not support weak references are not cached.
+        pass
+
+    return items
+
+
+@functools.lru_cache(maxsize=128)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int):
+    """
+    Parse a YAML file once per (path, mtime, size) combination. Repeated
+    pipeline constructions from an unchanged file skip the parser entirely.
+    The mtime_ns and size arguments are only part of the cache key, so that
+    editing the file invalidates the cached entry.
+    """
+    import yaml
+    with open(path, 'r', encoding='utf-8') as file:
+        return _deep_freeze(yaml.load(file, Loader=_get_yaml_loader()))
+
+
+@dataclass(slots=True)
 class Stage:
     _num: int = None
     _id: str = None
@@ -46,6 +266,36 @@ class Stage:
     _timestamp_start: float = None
     _timestamp_end: float = None
     _duration: float = None
+    _param_plan: list = None
+
+    # Free list of discarded stages: rebuilding pipelines in a loop reuses
+    # the object headers instead of hitting the allocator per stage.
+    _pool: ClassVar[list] = []
+    _POOL_CAP: ClassVar[int] = 1024
+
+    @classmethod
+    def _acquire(cls, _num: int = None, _id: str = None) -> "Stage":
+        """
+        Return a Stage, reusing one from the free list when available.
+        """
+        if cls._pool:
+            stage = cls._pool.pop()
+            stage._num = _num
+            stage._id = _id
+            return stage
+        return cls(_num, _id)
+
+    @classmethod
+    def _release(cls, stage: "Stage"):
+        """
+        Reset a stage and park it on the free list for reuse. Stages
+        beyond the pool cap are simply dropped.
+        """
+        if len(cls._pool) >= cls._POOL_CAP:
+            return
+        for slot in cls.__slots__:
+            setattr(stage, slot, None)
+        cls._pool.append(stage)
 
 
 class Pipeline:
@@ -82,6 +332,10 @@ class Pipeline:
         Flag indicating whether to display verbose output.
     silent: bool
         Flag indicating whether to disable the progress bar.
+    profile: bool
+        Flag indicating whether to record per-stage timestamps and
+        durations. Disable it for pipelines of sub-millisecond stages where
+        the timing calls themselves are measurable.
     """
 
     def __init__(
@@ -94,13 +348,16 @@ class Pipeline:
             description: str = None,
             subtask: bool = False,
             verbose: bool = False,
-            silent: bool = False):
+            silent: bool = False,
+            profile: bool = True):
 
-        # First thing is knowing who is calling the pipeline.
-        caller = inspect.stack()[1]
-        self.caller_module = caller.frame.f_globals['__name__']
-        self.caller_filename = caller[0].f_code.co_filename
-        self.caller_filename = self.caller_filename.split('/')[-1]
+        # First thing is knowing who is calling the pipeline. sys._getframe
+        # grabs just the caller's frame, where inspect.stack() would build
+        # FrameInfo objects (with source lookups) for the whole stack.
+        caller_frame = sys._getframe(1)
+        self.caller_module = caller_frame.f_globals.get('__name__', '?')
+        self.caller_filename = \
+            os.path.basename(caller_frame.f_code.co_filename)
 
         self.host = host
         self.pipeline = []
@@ -109,10 +366,32 @@ class Pipeline:
         self.description = description
         self.subtask = subtask
         self.silent = silent
+        self.profile = profile
         self.attributes_ = {}
         self.objects_ = {'host': self.host}
+        # Single-lookup view over the objects and attributes created by the
+        # pipeline; both underlying dicts stay live through it.
+        self._scope = ChainMap(self.objects_, self.attributes_)
+        # Snapshot of the host's attribute names, used as a fast positive
+        # cache to avoid repeated hasattr reflection in `_build_params`.
+        self._host_attrs = set(dir(self.host))
+        # Memoized results of `_get_callable_method`, keyed by
+        # (method_name, class_name). Cleared whenever a stage creates a new
+        # attribute, since that can change how names resolve.
+        self._callable_cache = {}
+        # Memoized `_parse_step` results for host-independent step shapes,
+        # so rebuilding a pipeline from the same template skips reparsing.
+        self._parse_cache = {}
+        # Indexes over the pipeline backing the contains_*/argument queries,
+        # memoized per frozen pipeline tuple and rebuilt when it changes.
+        self._index_source = None
+        self._by_method = None
+        self._by_class = None
+        self._by_argname = None
+        self._methods_blob = ""
         self.pbar = None
         self.run_ = False
+        self._closed = False
 
         # Rules to sort out what to display
         if silent:
@@ -125,7 +404,9 @@ class Pipeline:
         elif prog_bar:
             self.verbose = False
 
-        # Set logging.
+        # Set logging. The arguments are kept so `_reset` can bring the
+        # logger back on a pipeline that was already closed.
+        self._log_args = (log_name, log_level, log_fname)
         self.logger = LogConfig.setup_logging(
             name=log_name, level=log_level, fname=log_fname,
             caller_filename=self.caller_filename)
@@ -135,7 +416,12 @@ class Pipeline:
         """
         Close the pipeline.
         """
+        # Repeated closes (e.g. a test plus its fixture teardown) are no-ops.
+        if self._closed:
+            return
+        self._closed = True
         self._pbar_close()
+        self.pbar = None
         self.logger.debug('Pipeline closed')
         self.logger = None
         logging.shutdown()
@@ -160,25 +446,21 @@ class Pipeline:
         # Assert steps list is not empty
         assert steps, "List of steps is empty. No steps to run."
 
-        self._m(
-            f"Into '{self.from_list.__name__}' with '{len(steps)}' steps")
+        debugging = self.verbose or self.logger.isEnabledFor(logging.DEBUG)
+        if debugging:
+            self._m(
+                f"Into '{self.from_list.__name__}' with '{len(steps)}' steps")
+        pipeline = list(self.pipeline)
         for step_number, step_name in enumerate(steps):
-            # Create a new stage of type Stage, and initialize it with the step number
-            # and a random id.
-            stage = Stage(
-                step_number, f"{getrandbits(32):08x}",
-                None, None, None, None, None, None)
-
-            self._m(f"> Step #{step_number}({stage._id}) {str(step_name)}")
+            stage = self._build_stage(step_number, step_name)
+            if debugging:
+                self._m(f"> Step #{step_number}({stage._id}) {str(step_name)}")
+            pipeline.append(stage)
 
-            # Get the method to be called, the parameters that the
-            # method accepts and the arguments to be passed to the method.
-            # The variable name is the name to be given to the result of the call.
-            # vble_name, step_call, step_parameters, step_arguments = \
-            #     self._get_step_components(step_name, stage)
-            stage = self._get_step_components(step_name, stage)
-
-            self.pipeline.append(stage)
+        # Freeze the built pipeline: run and the queries only read it, and
+        # tuple iteration is cheaper than list iteration.
+        self.pipeline = tuple(pipeline)
+        self._compile()
 
     def from_config(self, config_filename: str):
         """
@@ -192,14 +474,137 @@ class Pipeline:
         self._m(f"Into '{self.from_config.__name__}' with "
                 f"config_filename='{config_filename}'")
 
-        with open(config_filename, 'r', encoding='utf-8') as file:
-            config = yaml.safe_load(file)
+        # LibYAML's C loader is used when available; the pure-Python loader
+        # is the fallback, several times slower on large configs.
+        self.logger.debug(
+            "Using YAML loader: %s", _get_yaml_loader().__name__)
+
+        # In dev mode, always re-read the file; otherwise try the persistent
+        # stage cache first, then the in-memory cache of parsed files.
+        if os.environ.get("MLFORGE_DEV"):
+            import yaml
+            with open(config_filename, 'r', encoding='utf-8') as file:
+                # Frozen like the cached paths, so dev mode sees the same
+                # argument shapes as production loads.
+                config = _deep_freeze(
+                    yaml.load(file, Loader=_get_yaml_loader()))
+        else:
+            stages = self._load_stage_cache(config_filename)
+            if stages is not None:
+                self._m(f"> Loaded {len(stages)} stages from cache")
+                self.pipeline = tuple(stages)
+                self._compile()
+                return
+            stat = os.stat(config_filename)
+            config = _load_yaml_cached(
+                os.path.abspath(config_filename), stat.st_mtime_ns,
+                stat.st_size)
 
         # Retrieve the caller's module name
-        caller_module = inspect.stack()[1].frame.f_globals['__name__']
+        caller_module = sys._getframe(1).f_globals['__name__']
 
         # Process the config and set the pipeline steps
-        self.pipeline = self._process_config(config, caller_module)
+        self.pipeline = tuple(self._process_config(config, caller_module))
+        self._compile()
+
+        if not os.environ.get("MLFORGE_DEV"):
+            self._write_stage_cache(config_filename)
+
+    def _load_stage_cache(self, config_filename: str):
+        """
+        Load the pipeline stages from the JSON sidecar cache of a YAML
+        configuration file. JSON parsing plus a couple of getattr calls per
+        class is far cheaper than re-parsing and re-processing the YAML.
+
+        Parameters
+        ----------
+        config_filename: str
+            Name of the YAML configuration file.
+
+        Returns
+        -------
+        stages: list
+            List of pipeline stages, or None if there is no cache, the
+            cache is stale, or it cannot be reconstructed.
+        """
+        cache_filename = _cache_path(config_filename)
+        if not os.path.exists(cache_filename):
+            return None
+        # Any cache that cannot be read or has the wrong shape (truncated
+        # writes, foreign files) degrades to a re-parse of the YAML.
+        try:
+            with open(cache_filename, 'r', encoding='utf-8') as file:
+                cache = json.load(file)
+            if cache.get('hash') != _config_digest(config_filename):
+                return None
+
+            stages = []
+            for entry in cache['stages']:
+                stage = Stage._acquire(entry['num'], entry['id'])
+                stage.attribute_name = entry['attribute']
+                stage.method_name = entry['method']
+                if entry['class'] is not None:
+                    module_name, qualname = entry['class']
+                    try:
+                        stage.class_name = getattr(
+                            _get_module(module_name), qualname)
+                    except (ImportError, AttributeError):
+                        return None
+                # Arguments are frozen on load so a cache hit hands back
+                # the same read-only shapes the parse path produces.
+                stage.arguments = _deep_freeze(entry['arguments'])
+                stages.append(stage)
+            return stages
+        except (OSError, ValueError, AttributeError, KeyError, TypeError):
+            return None
+
+    def _write_stage_cache(self, config_filename: str):
+        """
+        Serialize the processed pipeline stages into the JSON sidecar cache,
+        written atomically next to the YAML configuration file. Configs with
+        non-serializable arguments are silently left uncached.
+        """
+        entries = []
+        for stage in self.pipeline:
+            # Non-string mapping keys would come back stringified from
+            # JSON, changing the method inputs between cold and cached
+            # runs: such configs are left uncached.
+            if _has_non_string_keys(stage.arguments):
+                return
+            class_ref = None
+            if stage.class_name is not None:
+                class_ref = [stage.class_name.__module__,
+                             stage.class_name.__qualname__]
+            entries.append({
+                'num': stage._num,
+                'id': stage._id,
+                'attribute': stage.attribute_name,
+                'method': stage.method_name,
+                'class': class_ref,
+                'arguments': _thaw(stage.arguments),
+            })
+
+        try:
+            payload = json.dumps(
+                {'hash': _config_digest(config_filename), 'stages': entries})
+        except TypeError:
+            return
+
+        cache_filename = _cache_path(config_filename)
+        try:
+            with open(cache_filename + '.tmp', 'w', encoding='utf-8') as file:
+                file.write(payload)
+            os.replace(cache_filename + '.tmp', cache_filename)
+        except OSError:
+            pass
+
+    @staticmethod
+    def clear_config_cache():
+        """
+        Clear the cache of parsed YAML configuration files. Useful in dev
+        mode, when the same file is edited and reloaded within one process.
+        """
+        _load_yaml_cached.cache_clear()
 
     def add_stages(self, stages: list):
         """
@@ -216,10 +621,109 @@ class Pipeline:
         # This method can be called wiht a pipeline that already has stages.
         last_idx = len(self.pipeline)
 
+        pipeline = list(self.pipeline)
         for idx, stage in enumerate(stages):
             stage._num = idx + last_idx
-            stage._id = f"{getrandbits(32):08x}"
-            self.pipeline.append(stage)
+            stage._id = f"{next(_stage_counter):08x}"
+            pipeline.append(stage)
+
+        self.pipeline = tuple(pipeline)
+        self._compile()
+
+    def _compile(self):
+        """
+        Pre-resolve the callable and its signature for every stage that
+        allows it, so that `run` does not repeat the reflection work on each
+        execution. Stages whose method can only be resolved against objects
+        created by earlier stages are left for `run` to resolve lazily.
+        """
+        for stage in self.pipeline:
+            if stage._method_call is not None:
+                continue
+            if stage.method_name is None and stage.class_name is None:
+                continue
+            try:
+                method_call = self._get_callable_method(
+                    stage.method_name, stage.class_name)
+            except (AttributeError, ValueError):
+                continue
+            if method_call is None:
+                continue
+            stage._method_call = method_call
+            stage._parameters = self._get_method_signature(method_call)
+            if 'self' in stage._parameters.keys():
+                stage._parameters.pop('self')
+            self._compile_param_plan(stage)
+
+    def _compile_param_plan(self, stage: Stage):
+        """
+        Translate the branching logic of `_build_params` into a flat list of
+        (opcode, name, value) operations for the stage, decided once instead
+        of on every run. Stages whose arguments do not validate against the
+        method signature keep no plan, so `run` falls back to
+        `_build_params` and raises there, as it always did.
+        """
+        arguments = stage.arguments
+        if arguments is not None:
+            for arg in arguments.keys():
+                if arg not in stage._parameters:
+                    return
+
+        parameters = stage._parameters
+        if isinstance(parameters, _Sig):
+            items = zip(parameters.names, parameters.defaults)
+        else:
+            items = parameters.items()
+
+        plan = []
+        for parameter, default_value in items:
+            if arguments is not None and parameter in arguments:
+                value = arguments[parameter]
+                if isinstance(value, str):
+                    # May name an object or host attribute: resolve at run.
+                    plan.append((_OP_DYNAMIC, parameter, value))
+                else:
+                    # Non-string arguments can never name an object, since
+                    # the keys of `objects_` are attribute names.
+                    plan.append((_OP_LITERAL, parameter, value))
+            else:
+                plan.append((_OP_SCOPE, parameter, default_value))
+
+        stage._param_plan = plan
+
+    def _exec_param_plan(self, stage: Stage) -> dict:
+        """
+        Execute the parameter-binding plan of a stage, returning the dict of
+        parameters to be passed to the method. Mirrors `_build_params`, with
+        all per-run type checks already decided at compile time.
+        """
+        if _execute_plan_native is not None:
+            return _execute_plan_native(stage._param_plan, self)
+
+        params = {}
+        for op, name, value in stage._param_plan:
+            if op == _OP_LITERAL:
+                params[name] = value
+            elif op == _OP_DYNAMIC:
+                resolved = self._scope.get(value, _MISSING)
+                if resolved is not _MISSING:
+                    params[name] = resolved
+                elif self._has_host_attr(value):
+                    params[name] = getattr(self.host, value)
+                else:   # It's a literal string
+                    params[name] = value
+            else:   # _OP_SCOPE
+                if self._has_host_attr(name):
+                    params[name] = getattr(self.host, name)
+                elif name in _G:
+                    params[name] = _G[name]
+                elif value is not inspect.Parameter.empty:
+                    params[name] = value
+                else:
+                    raise ValueError(
+                        f"Parameter \'{name}\' not found in host object "
+                        f"or globals")
+        return params
 
     def run(self, num_steps: int = None):
         """
@@ -236,59 +740,198 @@ class Pipeline:
         self._pbar_create(name=self.description, num_steps=n_steps)
         self._m(f"RUN pipeline with {len(self.pipeline)} steps")
 
+        # Building the per-step debug strings is wasted work when nobody will
+        # see them, so the formatting itself is gated on verbosity/log level.
+        debugging = self.verbose or self.logger.isEnabledFor(logging.DEBUG)
+
+        # Hoist the verbose/prog_bar decisions out of the stage loop: the
+        # callbacks are bound once and become no-ops when disabled.
+        separator = "-" * 100 if self.verbose else None
+        print_separator = print if self.verbose else _noop
+        update_pbar = self._pbar_update if self.prog_bar else _noop
+
+        # With profiling off, the per-step clock reads are skipped; per-step
+        # info logs are skipped whenever the logger would drop them anyway.
+        clock = time.perf_counter if self.profile else (lambda: 0.0)
+        log_info = self.logger.info \
+            if self.logger.isEnabledFor(logging.INFO) else _noop
+
         self.logger.info('Pipeline execution started')
         for stage_nr, stage in enumerate(self.pipeline):
-            self._m(f"  > Step #{stage._num:>03d}({stage._id})\n"
-                    f"    > attribute_name: {stage.attribute_name}\n"
-                    f"    > method_name: {stage.method_name}\n"
-                    f"    > class_name: {stage.class_name}\n"
-                    f"    > arguments: {stage.arguments}")
-            # Check if step_name is a method within Host, or in globals
-            stage._method_call = self._get_callable_method(
-                stage.method_name, stage.class_name)
-            stage._parameters = self._get_method_signature(stage._method_call)
-
-            # If step_parameters has 'self' as first key, remove it.
-            if 'self' in stage._parameters.keys():
-                stage._parameters.pop('self')
+            if debugging:
+                self._m(f"  > Step #{stage._num:>03d}({stage._id})\n"
+                        f"    > attribute_name: {stage.attribute_name}\n"
+                        f"    > method_name: {stage.method_name}\n"
+                        f"    > class_name: {stage.class_name}\n"
+                        f"    > arguments: {stage.arguments}")
+            # Resolve the callable lazily if `_compile` could not do it
+            # upfront (e.g. methods of objects created by earlier stages).
+            if stage._method_call is None:
+                # Check if step_name is a method within Host, or in globals
+                stage._method_call = self._get_callable_method(
+                    stage.method_name, stage.class_name)
+                stage._parameters = self._get_method_signature(
+                    stage._method_call)
+
+                # If step_parameters has 'self' as first key, remove it.
+                if 'self' in stage._parameters.keys():
+                    stage._parameters.pop('self')
 
             # Given the parameters that the method accepts and the arguments
             # passed for the method, build the parameters to be passed to the
             # method, using default values or values from the host object.
-            step_parameters = self._build_params(
-                stage._parameters, stage.arguments)
+            # Compiled stages carry a precomputed binding plan.
+            if stage._param_plan is not None:
+                step_parameters = self._exec_param_plan(stage)
+            else:
+                step_parameters = self._build_params(
+                    stage._parameters, stage.arguments)
 
-            self.logger.info("Running step #%03d(%s) started",
-                             stage._num, stage._id)
-            stage._timestamp_start = time.time()
+            log_info("Running step #%03d(%s) started",
+                     stage._num, stage._id)
+            stage._timestamp_start = clock()
             return_value = self._run_step(stage._method_call, step_parameters)
-            stage._timestamp_end = time.time()
+            stage._timestamp_end = clock()
             stage._duration = stage._timestamp_end - stage._timestamp_start
-            self.logger.info("Running step #%03d(%s) finished",
-                             stage._num, stage._id)
+            log_info("Running step #%03d(%s) finished",
+                     stage._num, stage._id)
 
             # If return value needs to be stored in a variable, do it.
             if stage.attribute_name is not None:
+                # New attributes can change how later names resolve, so the
+                # memoized lookups are dropped.
+                self._callable_cache.clear()
                 # If host is None, I assign the return value to the global variable
                 if self.host is None:
                     self.attributes_[stage.attribute_name] = return_value
                     # globals()[stage.attribute_name] = return_value
                 else:
                     setattr(self.host, stage.attribute_name, return_value)
+                    self._host_attrs.add(stage.attribute_name)
                 # Check if the new attribute created is an object and if so,
                 # add it to the list of objects.
                 if not isinstance(return_value, type):
                     self.objects_[stage.attribute_name] = return_value
                 self._m(f"      New attribute: <{stage.attribute_name}>")
 
-            print("-"*100) if self.verbose else None
-            self._pbar_update(self.description, stage_nr + 1)
+            print_separator(separator)
+            update_pbar(self.description, stage_nr + 1)
 
         self._pbar_close()
-        ProgBar.clear()
+        # Only runs that could have created a bar pay the rich import.
+        if self.prog_bar:
+            from mlforge.progbar import ProgBar
+            ProgBar.clear()
         self.logger.info('Pipeline execution finished')
         self.run_ = True
 
+    def run_batch(self, hosts: list, num_steps: int = None) -> list:
+        """
+        Run the same pipeline once per host. The pipeline is compiled a
+        single time; only the callables bound to a previous host are
+        resolved again per run, so the per-invocation reflection overhead is
+        amortized across the whole batch.
+
+        Parameters
+        ----------
+        hosts: list
+            Host objects to run the pipeline against, one run each.
+        num_steps: int
+            The number of steps that contains the pipeline. If not
+            specified, the number of steps in the pipeline is used.
+
+        Returns
+        -------
+        results: list
+            One dict per host, mapping the attribute names created by the
+            pipeline to the values produced for that host.
+        """
+        assert self.pipeline, "Pipeline is empty. No steps to run."
+        assert hosts, "List of hosts is empty. No runs to do."
+
+        original_host = self.host
+        results = []
+        try:
+            for host in hosts:
+                self._bind_host(host)
+                self.run(num_steps)
+                snapshot = {}
+                for stage in self.pipeline:
+                    if stage.attribute_name is None:
+                        continue
+                    if host is None:
+                        snapshot[stage.attribute_name] = \
+                            self.attributes_.get(stage.attribute_name)
+                    else:
+                        snapshot[stage.attribute_name] = \
+                            getattr(host, stage.attribute_name, None)
+                results.append(snapshot)
+        finally:
+            self._bind_host(original_host)
+
+        return results
+
+    def _bind_host(self, host):
+        """
+        Rebind the pipeline to a host, resetting the per-run resolution
+        state. Bound methods captured for a previous host (or for objects
+        created during a previous run) are dropped so `_compile` resolves
+        them again; module-level functions and classes stay compiled.
+        """
+        self.host = host
+        self.attributes_ = {}
+        self.objects_ = {'host': host}
+        self._scope = ChainMap(self.objects_, self.attributes_)
+        self._host_attrs = set(dir(host))
+        self._callable_cache.clear()
+        for stage in self.pipeline:
+            if stage._method_call is not None and \
+                    hasattr(stage._method_call, '__self__'):
+                stage._method_call = None
+                stage._parameters = None
+                stage._param_plan = None
+        self._compile()
+
+    def _reset(self, host: object = None, description: str = None,
+               prog_bar: bool = True):
+        """
+        Return the pipeline to its just-constructed state so a single
+        instance can be reused (for example across tests) instead of
+        being rebuilt; the logger and its handlers are kept, and are set
+        up again when the pipeline was closed. The host, description and
+        progress-bar flag take their constructor defaults unless given.
+        """
+        if self._closed:
+            log_name, log_level, log_fname = self._log_args
+            self.logger = LogConfig.setup_logging(
+                name=log_name, level=log_level, fname=log_fname,
+                caller_filename=self.caller_filename)
+            self._closed = False
+        self._pbar_close()
+        self.pbar = None
+        self.prog_bar = prog_bar
+        self.description = description
+        self.run_ = False
+        self.clear()
+        self._parse_cache.clear()
+        self._bind_host(host)
+
+    def _build_stage(self, step_number: int, forge_step) -> Stage:
+        """
+        Parse one forge step and return its fully populated Stage, fusing
+        the allocate/validate/parse round trip of `from_list` into a single
+        call per step.
+        """
+        assert forge_step is not None, "Forge step cannot be None"
+        assert isinstance(forge_step, (str, type, tuple)), \
+            f"Forge step '{forge_step}' must be a string, class name or a tuple"
+        assert len(forge_step) > 0, "Forge step cannot be an empty tuple"
+
+        stage = Stage._acquire(step_number, f"{next(_stage_counter):08x}")
+        stage.attribute_name, stage.method_name, stage.class_name, \
+            stage.arguments = self._parse_step(forge_step)
+        return stage
+
     def _get_step_components(self, forge_step: tuple, stage: Stage):
         """
         Get the components of a forge step, in a way that can be used to invoke it.
@@ -320,7 +963,7 @@ class Pipeline:
 
         return stage
 
-    def _get_method_signature(self, method_call: Callable):
+    def _get_method_signature(self, method_call: callable):
         """
         Get the signature of a method.
 
@@ -334,11 +977,9 @@ class Pipeline:
         method_parameters: dict
             A dictionary containing the method's parameters and their default values.
         """
-        parameters = inspect.signature(method_call).parameters
-        if parameters is None:
-            return None
-
-        return {arg: parameters[arg].default for arg in parameters.keys()}
+        # A fresh mapping is built from the cached introspection, so callers
+        # can mutate the result without corrupting the cache.
+        return _Sig(_signature_items(method_call))
 
     def _parse_step(self, forge_step):
         """
@@ -376,7 +1017,6 @@ class Pipeline:
         self._m(f"    > Into '{self._parse_step.__name__}' "
                 f"with forge_step='{forge_step}'")
 
-        attribute_name, method_name, class_name, parameters = None, None, None, None
         if not isinstance(forge_step, (tuple)):
             forge_step = (forge_step,)
 
@@ -384,84 +1024,70 @@ class Pipeline:
         assert len(forge_step) > 0 and len(forge_step) < 5, \
             f"Tuple '{forge_step}' must have between 1 and 4 elements"
 
-        # Checks---------------------------------------------------------------
-        # 'method_name'
-        # ClassHolder
-        # ('method_name')
-        # (ClassHolder)
-        if len(forge_step) == 1:
-            if isinstance(forge_step[0], str):
-                method_name = forge_step[0]
-            elif isinstance(forge_step[0], type):
-                class_name = forge_step[0]
-            else:
-                raise ValueError(
-                    f"Parameter \'{forge_step}\' must be a string or a class")
-        # Checks---------------------------------------------------------------
-        # ('method_name', ClassHolder)
-        # ('new_attribute', 'method_name')
-        # ('new_attribute', ClassHolder)
-        # ('method_name', {'param1': 'value1'})
-        elif len(forge_step) == 2:
-            if isinstance(forge_step[1], type):
-                # Check if the first element is a method name or an attribute name
-                if isinstance(forge_step[0], str) and \
-                        self._get_callable_method(
-                            forge_step[0], forge_step[1]) is not None:
-                    method_name, class_name = forge_step
-                elif isinstance(forge_step[0], str) and \
-                        self._get_callable_method(forge_step[0], forge_step[1]) is None:
-                    attribute_name, class_name = forge_step
-                else:
-                    raise ValueError(
-                        f"First element of tuple \'{forge_step}\' must be a string "
-                        f"or a method name, when the second element is a class")
-            elif isinstance(forge_step[1], dict) and isinstance(forge_step[0], str):
-                method_name, parameters = forge_step
-            elif isinstance(forge_step[0], str) and isinstance(forge_step[1], str):
-                attribute_name, method_name = forge_step
-            else:
-                raise ValueError(
-                    f"Tuple \'{forge_step}\' with 2 elements must be either "
-                    f"(str, class), (str, str) or (str, dict)")
-        # Checks---------------------------------------------------------------
-        # ('new_attribute', 'method_name',  ClassHolder)
-        # ('new_attribute', 'method_name', {'param1': 'value1'})
-        # ('new_attribute',  ClassHolder,  {'param1': 'value1'})
-        # ('method_name',    ClassHolder,  {'param1': 'value1'})
-        elif len(forge_step) == 3:
-            if isinstance(forge_step[0], str) and isinstance(forge_step[1], str):
-                if isinstance(forge_step[2], type):
-                    attribute_name, method_name, class_name = forge_step
-                elif isinstance(forge_step[2], dict):
-                    attribute_name, method_name, parameters = forge_step
-                else:
-                    raise ValueError(
-                        f"Tuple \'{forge_step}\' with 3 elements must be "
-                        f"(str, str, class) or (str, str, dict)")
-            elif self._get_callable_method(forge_step[0], forge_step[1]) is None and \
-                    isinstance(forge_step[1], type):
-                attribute_name, class_name, parameters = forge_step
-            elif self._get_callable_method(forge_step[0], forge_step[1]) is not None \
-                    and isinstance(forge_step[1], type):
-                method_name, class_name, parameters = forge_step
-            else:
-                raise ValueError(
-                    f"Tuple \'{forge_step}\' with 3 elements must be either "
-                    f"(str, str, dict) or (str, class, dict)")
-        # Checks---------------------------------------------------------------
-        # ('new_attribute', 'method_name', ClassHolder, {'param1': 'value1'})
-        # ('new_attribute', 'method_name', 'object_name', {'param1': 'value1'})
-        elif len(forge_step) == 4:
-            if isinstance(forge_step[1], str) and isinstance(forge_step[2], type) and \
-                    isinstance(forge_step[3], dict):
-                attribute_name, method_name, class_name, parameters = forge_step
-            else:
-                raise ValueError(
-                    f"Tuple \'{forge_step}\' with 4 elements must be "
-                    f"(str, str, class, dict)")
-
-        return (attribute_name, method_name, class_name, parameters)
+        # A single hashed lookup on the tuple's type signature replaces the
+        # former cascade of per-shape isinstance branches.
+        key = ''.join(_step_tag(element) for element in forge_step)
+        handler = self._PARSE_TABLE.get(key)
+        if handler is None:
+            raise ValueError(
+                self._PARSE_ERRORS[len(forge_step)].format(step=forge_step))
+
+        # Memoize host-independent shapes: the ambiguous ('name', Class)
+        # forms consult the host to disambiguate, so they stay uncached.
+        # Dict elements are keyed by their items when hashable.
+        cache_key = None
+        if key not in ('st', 'std'):
+            try:
+                cache_key = (key, tuple(
+                    frozenset(e.items()) if type(e) is dict else e
+                    for e in forge_step))
+                parsed = self._parse_cache.get(cache_key, _MISSING)
+                if parsed is not _MISSING:
+                    return parsed
+            except TypeError:
+                cache_key = None
+
+        parsed = handler(self, forge_step)
+        if cache_key is not None:
+            self._parse_cache[cache_key] = parsed
+        return parsed
+
+    def _parse_ambiguous_class_step(self, forge_step):
+        """
+        Disambiguate ('name', ClassHolder) and ('name', ClassHolder, {...})
+        steps: the first element is a method name when the class resolves it,
+        and the name of a new attribute otherwise.
+        """
+        parameters = forge_step[2] if len(forge_step) == 3 else None
+        if self._get_callable_method(forge_step[0], forge_step[1]) is not None:
+            return (None, forge_step[0], forge_step[1], parameters)
+        return (forge_step[0], None, forge_step[1], parameters)
+
+    # Dispatch table for `_parse_step`, keyed by the type signature of the
+    # forge step ('s'tring, 't'ype, 'd'ict). Each handler returns the
+    # (attribute_name, method_name, class_name, parameters) 4-tuple.
+    _PARSE_TABLE = {
+        's': lambda self, s: (None, s[0], None, None),
+        't': lambda self, s: (None, None, s[0], None),
+        'ss': lambda self, s: (s[0], s[1], None, None),
+        'st': _parse_ambiguous_class_step,
+        'sd': lambda self, s: (None, s[0], None, s[1]),
+        'sst': lambda self, s: (s[0], s[1], s[2], None),
+        'ssd': lambda self, s: (s[0], s[1], None, s[2]),
+        'std': _parse_ambiguous_class_step,
+        'sstd': lambda self, s: (s[0], s[1], s[2], s[3]),
+    }
+
+    # Error messages raised when a forge step matches none of the accepted
+    # type signatures of its length.
+    _PARSE_ERRORS = {
+        1: "Parameter '{step}' must be a string or a class",
+        2: "Tuple '{step}' with 2 elements must be either "
+           "(str, class), (str, str) or (str, dict)",
+        3: "Tuple '{step}' with 3 elements must be either "
+           "(str, str, class), (str, str, dict) or (str, class, dict)",
+        4: "Tuple '{step}' with 4 elements must be (str, str, class, dict)",
+    }
 
     def _get_callable_method(
             self,
@@ -481,6 +1107,22 @@ class Pipeline:
         method: callable
             Method to be called, or None if the method is not found.
         """
+        key = (method_name, class_name)
+        if key in self._callable_cache:
+            return self._callable_cache[key]
+
+        method = self._resolve_callable_method(method_name, class_name)
+        self._callable_cache[key] = method
+        return method
+
+    def _resolve_callable_method(
+            self,
+            method_name: str,
+            class_name: type = None) -> callable:
+        """
+        Uncached resolution behind `_get_callable_method`. See that method
+        for the lookup rules.
+        """
         self._m(f"      > Into '{self._get_callable_method.__name__}' with "
                 f"method_name='{method_name}', class_name='{class_name}'")
 
@@ -495,8 +1137,11 @@ class Pipeline:
                 if hasattr(class_name, method_name):
                     return getattr(class_name, method_name)
             else:
+                # The class exists, so its module is almost always loaded
+                # already: hit sys.modules first and skip the import lock.
                 module_name = class_name.__module__
-                module = import_module(module_name)
+                module = sys.modules.get(module_name) or \
+                    import_module(module_name)
                 return getattr(module, class_name.__name__)
             return None
 
@@ -531,6 +1176,19 @@ class Pipeline:
 
         return None
 
+    def _has_host_attr(self, name: str) -> bool:
+        """
+        Check whether the host object has the given attribute, using the
+        `_host_attrs` snapshot as a fast path and falling back to `hasattr`
+        for attributes created by the host itself during the run.
+        """
+        if name in self._host_attrs:
+            return True
+        if hasattr(self.host, name):
+            self._host_attrs.add(name)
+            return True
+        return False
+
     def _build_params(self, method_parameters, method_arguments) -> dict:
         """
         This method builds the parameters to be passed to the method, using default
@@ -549,13 +1207,19 @@ class Pipeline:
             Dictionary containing the parameters to be passed to the method.
 
         """
-        self._m(
-            f"        > Into '{self._build_params.__name__}' with "
-            f"method_parameters='{method_parameters}', "
-            f"method_arguments='{method_arguments}'")
+        if self.verbose or self.logger.isEnabledFor(logging.DEBUG):
+            self._m(
+                f"        > Into '{self._build_params.__name__}' with "
+                f"method_parameters='{method_parameters}', "
+                f"method_arguments='{method_arguments}'")
+
+        if isinstance(method_parameters, _Sig):
+            items = zip(method_parameters.names, method_parameters.defaults)
+        else:
+            items = method_parameters.items()
 
         params = {}
-        for parameter, default_value in method_parameters.items():
+        for parameter, default_value in items:
             if method_arguments is not None:
                 # If the parameter is in method_arguments, use the value from
                 # method_arguments.
@@ -563,16 +1227,19 @@ class Pipeline:
                     # Two possibilities here: either the parameter is a normal value,
                     # in which case we simply take it, or is the name of an object
                     # created in a previous step, in which case we take the object.
-                    # But first, check if the parameter is hashable.
-                    if not isinstance(method_arguments[parameter], typing.Hashable):
+                    # The scope lookup itself rejects unhashable values,
+                    # without paying for a Hashable protocol isinstance check.
+                    try:
+                        value = self._scope.get(
+                            method_arguments[parameter], _MISSING)
+                    except TypeError:
                         params[parameter] = method_arguments[parameter]
                         continue
-                    if method_arguments[parameter] in self.objects_:
-                        params[parameter] = self.objects_[
-                            method_arguments[parameter]]
+                    if value is not _MISSING:
+                        params[parameter] = value
                     # XXX experimental
                     elif isinstance(method_arguments[parameter], str):
-                        if hasattr(self.host, method_arguments[parameter]):
+                        if self._has_host_attr(method_arguments[parameter]):
                             params[parameter] = getattr(
                                 self.host, method_arguments[parameter])
                         else: # It's a literal string
@@ -583,10 +1250,10 @@ class Pipeline:
                     continue
 
             # But always, try to get the parameter from the host object or globals.
-            if hasattr(self.host, parameter):
+            if self._has_host_attr(parameter):
                 params[parameter] = getattr(self.host, parameter)
-            elif parameter in globals():
-                params[parameter] = globals()[parameter]
+            elif parameter in _G:
+                params[parameter] = _G[parameter]
             # or if the parameter has a default value, use it.
             elif default_value is not inspect.Parameter.empty:
                 params[parameter] = default_value
@@ -608,8 +1275,8 @@ class Pipeline:
 
     def _run_step(
             self,
-            step_name: Union[Any, str],
-            list_of_params: List[Any] = None) -> Any:
+            step_name: callable | str,
+            list_of_params: list = None):
         """
         Run a step of the pipeline.
 
@@ -687,6 +1354,10 @@ class Pipeline:
         """
         Show the pipeline. Print cards with the steps and the description of each step.
         """
+        from rich import print as rp
+        from rich.columns import Columns
+        from rich.table import Table
+
         columns_layout = []
         table = []
         num_stages = len(self.pipeline)
@@ -695,24 +1366,28 @@ class Pipeline:
             table[i].add_column(
                 f"[white]Stage #{i}, id: #{self.pipeline[i]._id}[/white]",
                 justify="left", no_wrap=True)
-            line = ""
-            # Loop through the elements of the stage tuple
-            for k, v in asdict(self.pipeline[i]).items():
-                if k == '_num' or k == '_id' or k == '_method_call' or \
-                    k == "_parameters" or k == "_timestamp_start" or \
-                        k == "_timestamp_end" or k == "_duration" or v is None:
+            # Collect the rendered fields in a list and join once, instead of
+            # growing a string by repeated concatenation.
+            parts = []
+            # Loop through the fields of the stage, without materializing the
+            # whole dataclass as a dict.
+            for field in fields(self.pipeline[i]):
+                k, v = field.name, getattr(self.pipeline[i], field.name)
+                if k in _SHOW_SKIP or v is None:
                     continue
-                if isinstance(v, dict) and v:
-                    line += f"[yellow1]{k}[/yellow1]:\n"
+                # Config-loaded stages carry frozen (mapping proxy)
+                # arguments, which must render per-key like plain dicts.
+                if isinstance(v, (dict, types.MappingProxyType)) and v:
+                    parts.append(f"[yellow1]{k}[/yellow1]:\n")
                     for k1, v1 in v.items():
-                        line += f"- [orange1]{k1}[/orange1]: {v1}\n"
+                        parts.append(f"- [orange1]{k1}[/orange1]: {v1}\n")
                 elif isinstance(v, type):
-                    line += f"[yellow1]{k}[/yellow1]: {v.__name__}\n"
+                    parts.append(f"[yellow1]{k}[/yellow1]: {v.__name__}\n")
                 else:
-                    line += f"[yellow1]{k}[/yellow1]: {v}\n"
+                    parts.append(f"[yellow1]{k}[/yellow1]: {v}\n")
 
-            # Remove trailing newline from `line`
-            line = line.rstrip("\n")
+            # Join the parts, without the trailing newline
+            line = "".join(parts).rstrip("\n")
             table[i].add_row(line)
             columns_layout.append(table[i])
             if i < num_stages-1:
@@ -729,23 +1404,17 @@ class Pipeline:
         and the last line represents the total duration of the pipeline.
         """
         print("Duration of each stage of the pipeline:")
+        # Accumulate the total in the same pass used for printing, instead
+        # of traversing the pipeline a second time.
+        total_duration = 0.0
         for stage in self.pipeline:
-            if stage._duration < 1:
-                print(
-                    f"Stage #{stage._num:>03d} ({stage._id}): "
-                    f"{stage._duration*1000:.03f} ms")
-            else:
-                print(
-                    f"Stage #{stage._num:>03d} ({stage._id}): "
-                    f"{stage._duration:.2f} s")
-
-        total_duration = sum([stage._duration for stage in self.pipeline])
-        if total_duration < 1:
-            print(
-                f"Total duration: {total_duration*1000:.03f} ms")
-        else:
-            print(
-                f"Total duration: {total_duration:.2f} s")
+            total_duration += stage._duration
+            scale, fmt = _STAGE_DUR_FMT[stage._duration < 1]
+            print(fmt.format(num=stage._num, id=stage._id,
+                             v=stage._duration * scale))
+
+        scale, fmt = _DUR_FMT[total_duration < 1]
+        print("Total duration: " + fmt.format(total_duration * scale))
 
     def len(self):
         """
@@ -753,6 +1422,37 @@ class Pipeline:
         """
         return len(self.pipeline)
 
+    def clear(self):
+        """
+        Empty the pipeline, returning its stages to the Stage free list so
+        a rebuilt pipeline reuses them instead of reallocating.
+        """
+        for stage in self.pipeline:
+            if isinstance(stage, Stage):
+                Stage._release(stage)
+        self.pipeline = []
+        self._index_source = None
+
+    def _resolve_config_class(self, value, module):
+        """
+        Resolve a class name from a configuration file against the caller's
+        module.
+        """
+        try:
+            return getattr(module, value)
+        except AttributeError as exc:
+            raise AttributeError(
+                f"Class '{value}' not found in module '{module}'") from exc
+
+    # Map of config keys to the (Stage attribute, transform) pair applied by
+    # `_process_config`; a None transform stores the value as-is.
+    _STAGE_SETTERS = {
+        'attribute': ('attribute_name', None),
+        'method': ('method_name', None),
+        'class': ('class_name', _resolve_config_class),
+        'arguments': ('arguments', None),
+    }
+
     def _process_config(self, config: dict, caller_module) -> dict:
         """
         Process the YAML configuration and convert it into a list of pipeline steps.
@@ -770,28 +1470,18 @@ class Pipeline:
         steps = []
 
         self._m(f"> caller_module: {caller_module}")
-        module = importlib.import_module(caller_module)
+        module = _get_module(caller_module)
 
         for nr, (step_id, step_contents) in enumerate(config.items()):
-            stage = Stage()
-            stage._num = nr
-            stage._id = step_id
+            stage = Stage._acquire(nr, step_id)
             for k, v in step_contents.items():
-                if k == 'attribute':
-                    stage.attribute_name = v
-                elif k == 'method':
-                    stage.method_name = v
-                elif k == 'class':
-                    try:
-                        stage.class_name = getattr(module, v)
-                    except AttributeError as exc:
-                        raise AttributeError(
-                            f"Class '{v}' not found in module '{module}'") from exc
-                elif k == 'arguments':
-                    stage.arguments = v
-                else:
+                setter = self._STAGE_SETTERS.get(k)
+                if setter is None:
                     raise ValueError(
                         f"Key '{k}' not recognized in the configuration")
+                attr, transform = setter
+                setattr(stage, attr,
+                        transform(self, v, module) if transform else v)
             steps.append(stage)
 
         self._m(f"> Processed {len(steps)} steps")
@@ -810,7 +1500,7 @@ class Pipeline:
             return self.attributes_[attribute_name]
         raise AttributeError(f"Attribute '{attribute_name}' not found")
 
-    def _pbar_create(self, name: str, num_steps: int) -> ProgBar:
+    def _pbar_create(self, name: str, num_steps: int):
         """
             Creates a progress bar using the tqdm library.
 
@@ -824,8 +1514,9 @@ class Pipeline:
             Returns:
                 A ProgBar object.
         """
-        if len(self.pipeline) == 0 or self.silent or not self.prog_bar:
+        if not self.prog_bar or self.silent or len(self.pipeline) == 0:
             return None
+        from mlforge.progbar import ProgBar
         self.pbar = ProgBar(
             name=name, num_steps=num_steps, verbose=self.verbose)
 
@@ -858,11 +1549,71 @@ class Pipeline:
         """
         if self.verbose:
             print(m)
-        m = m.replace('  ', '')
-        m = m.replace('> ', '')
-        # Remove any newline character from the message
-        m = m.replace('\n', '')
-        self.logger.debug(m)
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        # Strip indentation, prompt markers and newlines in a single pass.
+        self.logger.debug(_M_STRIP.sub('', m))
+
+    def _query_index(self):
+        """
+        Return the (by_method, by_class, by_argname) indexes of the current
+        pipeline. Only the frozen (tuple) form the builders produce is
+        memoized: every mutating entry point replaces that tuple, so its
+        identity doubles as the validity check. Pipelines assigned as
+        plain lists stay mutable in the caller's hands and are rescanned
+        on every query, like the original linear scans. With the indexes
+        in place, the contains_*/argument queries on built pipelines are
+        dict lookups instead of linear scans over the stages.
+        """
+        pipeline = self.pipeline
+        if not isinstance(pipeline, tuple):
+            return self._scan_pipeline(pipeline)
+
+        if pipeline is not self._index_source:
+            self._by_method, self._by_class, self._by_argname = \
+                self._scan_pipeline(pipeline)
+            self._index_source = pipeline
+
+        return self._by_method, self._by_class, self._by_argname
+
+    def _scan_pipeline(self, pipeline):
+        """
+        Build the (by_method, by_class, by_argname) indexes from a single
+        pass over the stages, refreshing the method-name blob as well.
+        """
+        by_method = {}
+        by_class = set()
+        by_argname = {}
+        # getattr with a default keeps this working for reduced stage
+        # stand-ins that only define some of the fields.
+        for stage in pipeline:
+            method_name = getattr(stage, 'method_name', None)
+            if method_name is not None:
+                by_method[method_name] = by_method.get(method_name, 0) + 1
+            class_name = getattr(stage, 'class_name', None)
+            if class_name is not None:
+                by_class.add(class_name)
+            arguments = getattr(stage, 'arguments', None)
+            if arguments:
+                for arg_name, value in arguments.items():
+                    if value is not None:
+                        by_argname.setdefault(arg_name, []).append(value)
+        # Sentinel-joined blob of the method names: substring queries can
+        # reject misses with a single C-level string search.
+        self._methods_blob = "\x01".join(by_method)
+        return by_method, by_class, by_argname
+
+    def _check_query_arg(self, name: str, value):
+        """
+        Shared validation preamble of the pipeline query methods: the
+        argument must be a non-None string and the pipeline must exist.
+        """
+        if value is None:
+            raise ValueError(f"{name} must not be None")
+        if self.pipeline is None:
+            raise ValueError("pipeline must not be None")
+        if not isinstance(value, str):
+            raise TypeError(f"{name} must be a string.")
 
     def contains_method(self, method_name: str, exact_match: bool = False) -> bool:
         """
@@ -881,29 +1632,59 @@ class Pipeline:
         stage: int
             The number of times that the method is found.
         """
-        if method_name is None:
-            raise ValueError("method_name must not be None")
+        self._check_query_arg("method_name", method_name)
+        if not isinstance(exact_match, bool):
+            raise TypeError("exact_match must be a boolean.")
+
+        by_method, _, _ = self._query_index()
+        if exact_match:
+            return by_method.get(method_name, 0)
+        if method_name not in self._methods_blob:
+            return 0
+        return sum(count for name, count in by_method.items()
+                   if method_name in name)
+
+    def contains_methods(self, method_names, exact_match: bool = False) -> dict:
+        """
+        Batch version of `contains_method`: count several method names in a
+        single pass over the index instead of one query per name.
+
+        Parameters
+        ----------
+        method_names: Iterable[str]
+            The names of the methods to check.
+        exact_match: bool
+            If True, each method name must match exactly. If False, each
+            name can be any substring of a method name.
+
+        Returns
+        -------
+        counts: dict
+            Mapping of each queried name to the number of times it is found.
+        """
+        if method_names is None:
+            raise ValueError("method_names must not be None")
         if self.pipeline is None:
             raise ValueError("pipeline must not be None")
-
-        if not isinstance(method_name, str):
-            raise TypeError("method_name must be a string.")
         if not isinstance(exact_match, bool):
             raise TypeError("exact_match must be a boolean.")
+        method_names = list(method_names)
+        for method_name in method_names:
+            if not isinstance(method_name, str):
+                raise TypeError("method_name must be a string.")
 
-        num_found = 0
+        by_method, _, _ = self._query_index()
         if exact_match:
-            for stage in self.pipeline:
-                if stage.method_name == method_name:
-                    num_found += 1
-        else:
-            for stage in self.pipeline:
-                if stage.method_name is None:
-                    continue
-                if method_name in stage.method_name:
-                    num_found += 1
+            return {name: by_method.get(name, 0) for name in method_names}
 
-        return num_found
+        counts = dict.fromkeys(method_names, 0)
+        blob = self._methods_blob
+        pending = [name for name in method_names if name in blob]
+        for method_name, count in by_method.items():
+            for name in pending:
+                if name in method_name:
+                    counts[name] += count
+        return counts
 
     def contains_class(self, class_name: str) -> bool:
         """
@@ -919,15 +1700,10 @@ class Pipeline:
         stage: Stage
             The stage that contains the class.
         """
-        if class_name is None:
-            raise ValueError("class_name must not be None")
-        if self.pipeline is None:
-            raise ValueError("pipeline must not be None")
-
-        if not isinstance(class_name, str):
-            raise TypeError("class_name must be a string.")
+        self._check_query_arg("class_name", class_name)
 
-        return any(stage.class_name == class_name for stage in self.pipeline)
+        _, by_class, _ = self._query_index()
+        return class_name in by_class
 
     def contains_argument(self, attribute_name: str) -> bool:
         """
@@ -943,24 +1719,10 @@ class Pipeline:
         stage: Stage
             The number of times that the argument is found.
         """
-        if attribute_name is None:
-            raise ValueError("attribute_name must not be None")
-        if self.pipeline is None:
-            raise ValueError("pipeline must not be None")
+        self._check_query_arg("attribute_name", attribute_name)
 
-        if not isinstance(attribute_name, str):
-            raise TypeError("attribute_name must be a string.")
-
-        # Go through every stage in the pipeline, and then through every argument,
-        # if any, to check if the attribute_name matches
-        num_found = 0
-        for stage in self.pipeline:
-            # Check if there's an argument
-            if stage.arguments is not None:
-                if stage.arguments.get(attribute_name) is not None:
-                    num_found += 1
-
-        return num_found
+        _, _, by_argname = self._query_index()
+        return len(by_argname.get(attribute_name, ()))
 
     def get_argument_value(self, attribute_name: str):
         """
@@ -976,23 +1738,11 @@ class Pipeline:
         attribute_value: Any
             The value of the attribute.
         """
-        if attribute_name is None:
-            raise ValueError("attribute_name must not be None")
-        if self.pipeline is None:
-            raise ValueError("pipeline must not be None")
-
-        if not isinstance(attribute_name, str):
-            raise TypeError("attribute_name must be a string.")
+        self._check_query_arg("attribute_name", attribute_name)
 
-        # Go through every stage in the pipeline, and then through every argument,
-        # if any, to check if the attribute_name matches
-        for stage in self.pipeline:
-            # Check if there's an argument
-            if stage.arguments is not None:
-                if stage.arguments.get(attribute_name) is not None:
-                    return stage.arguments[attribute_name]
-
-        return None
+        _, _, by_argname = self._query_index()
+        values = by_argname.get(attribute_name)
+        return values[0] if values else None
 
     def all_argument_values(self, attribute_name:str):
         """
@@ -1010,13 +1760,9 @@ class Pipeline:
             A list with all values of the attribute.
         """
         assert attribute_name is not None, "attribute_name must not be None"
-        assert self.pipeline != [], "pipeline must be initialized"
+        # Truthiness also covers the frozen (tuple) form of the pipeline.
+        assert self.pipeline, "pipeline must be initialized"
         assert isinstance(attribute_name, str), "attribute_name must be a string"
 
-        attribute_values = []
-        for stage in self.pipeline:
-            if stage.arguments is not None:
-                if stage.arguments.get(attribute_name) is not None:
-                    attribute_values.append(stage.arguments[attribute_name])
-
-        return attribute_values
+        _, _, by_argname = self._query_index()
+        return list(by_argname.get(attribute_name, ()))
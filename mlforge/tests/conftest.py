@@ -0,0 +1,15 @@
+"""
+Shared pytest configuration: put the repository root on sys.path once,
+instead of every test module resolving it again at import time.
+"""
+
+import logging
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+# Configure logging before any Pipeline does: the root level gates the
+# per-step debug/info messages, and claiming the root handlers here keeps
+# LogConfig's basicConfig from opening a log file during tests.
+logging.basicConfig(level=logging.WARNING)
@@ -12,14 +12,9 @@ Tests for the add_stages method.
 # pylint: disable=W0612:unused-variable, E0602:undefined-variable
 # pylint: disable=C0413:wrong-import-position
 
-import os
-import sys
 import string
 
 
-sys.path.insert(0, os.path.abspath(
-    os.path.join(os.path.dirname(__file__), '../mlforge')))
-
 from mlforge.mlforge import Pipeline, Stage
 
 class TestAddStages:
@@ -12,15 +12,10 @@ Tests for the build_params method.
 # pylint: disable=W0612:unused-variable, E0602:undefined-variable
 # pylint: disable=C0413:wrong-import-position
 
-import os
-import sys
 
 import pytest
 
 
-sys.path.insert(0, os.path.abspath(
-    os.path.join(os.path.dirname(__file__), '../mlforge')))
-
 from mlforge.mlforge import Pipeline
 
 
@@ -0,0 +1,87 @@
+"""
+
+Tests for the precompile command of mlforge.cli.
+
+"""
+# pylint: disable=C0116:missing-function-docstring, C0115:missing-class-docstring
+# pylint: disable=W0212:protected-access
+
+import importlib.util
+import sys
+
+import pytest
+
+from mlforge.cli import precompile
+from mlforge.mlforge import Stage
+
+
+STAGES_MODULE = (
+    "class Worker:\n"
+    "    def compute(self, x=1):\n"
+    "        return x * 2\n"
+)
+
+YAML_CONFIG = (
+    "step1:\n"
+    "  method: compute\n"
+    "  arguments:\n"
+    "    x: 3\n"
+    "step2:\n"
+    "  attribute: result\n"
+    "  method: compute\n"
+    "  class: Worker\n"
+)
+
+
+def _import_from(path):
+    spec = importlib.util.spec_from_file_location("pipeline_compiled", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class Test_Precompile:
+
+    # Generates a module whose build() reconstructs the configured stages.
+    def test_generate_import_build_round_trip(self, tmp_path):
+        (tmp_path / "stagesmod.py").write_text(STAGES_MODULE)
+        config_file = tmp_path / "pipeline.yaml"
+        config_file.write_text(YAML_CONFIG)
+
+        sys.path.insert(0, str(tmp_path))
+        try:
+            output = precompile(str(config_file), module="stagesmod")
+            stages = _import_from(output).build()
+        finally:
+            sys.path.remove(str(tmp_path))
+
+        assert len(stages) == 2
+        assert all(isinstance(stage, Stage) for stage in stages)
+        assert stages[0]._id == 'step1'
+        assert stages[0].method_name == 'compute'
+        assert stages[0].arguments == {'x': 3}
+        assert stages[1].attribute_name == 'result'
+        assert stages[1].class_name.__name__ == 'Worker'
+
+    # Values whose repr is not a literal must fail at generation time.
+    def test_non_literal_value_fails_at_precompile(self, tmp_path):
+        config_file = tmp_path / "pipeline.yaml"
+        config_file.write_text(
+            "step1:\n"
+            "  method: compute\n"
+            "  arguments:\n"
+            "    start: 2024-01-01\n")
+
+        with pytest.raises(ValueError, match="cannot be emitted"):
+            precompile(str(config_file))
+
+    # Class entries require the module they resolve against.
+    def test_class_without_module_fails(self, tmp_path):
+        config_file = tmp_path / "pipeline.yaml"
+        config_file.write_text(
+            "step1:\n"
+            "  method: compute\n"
+            "  class: Worker\n")
+
+        with pytest.raises(ValueError, match="pass --module"):
+            precompile(str(config_file))
@@ -42,4 +42,27 @@ def test_contains_method_invalid_method_name_type(pipeline):
 
 def test_contains_method_invalid_exact_match_type(pipeline):
     with pytest.raises(TypeError):
-        pipeline.contains_method("method_one", exact_match="True")
\ No newline at end of file
+        pipeline.contains_method("method_one", exact_match="True")
+
+def test_contains_method_sees_in_place_mutation(pipeline):
+    assert pipeline.contains_method("method_one", exact_match=True) == 1
+    pipeline.pipeline[0].method_name = "gamma"
+    assert pipeline.contains_method("gamma", exact_match=True) == 1
+    assert pipeline.contains_method("method_one", exact_match=True) == 0
+
+def test_contains_methods_exact_match(pipeline):
+    counts = pipeline.contains_methods(
+        ["method_one", "another_method", "non_existent_method"],
+        exact_match=True)
+    assert counts == {
+        "method_one": 1, "another_method": 1, "non_existent_method": 0}
+
+def test_contains_methods_partial_match(pipeline):
+    counts = pipeline.contains_methods(["method", "another", "non_existent"])
+    assert counts == {"method": 3, "another": 1, "non_existent": 0}
+
+def test_contains_methods_invalid_names(pipeline):
+    with pytest.raises(ValueError):
+        pipeline.contains_methods(None)
+    with pytest.raises(TypeError):
+        pipeline.contains_methods(["method_one", 123])
\ No newline at end of file
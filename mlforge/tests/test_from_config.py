@@ -11,13 +11,11 @@ Test the read of the configuration file and the creation of the pipeline
 # pylint: disable=missing-function-docstring
 # pylint: disable=W0212:protected-access, C0413:wrong-import-position
 
-import os
-import sys
 
-sys.path.insert(0, os.path.abspath(
-    os.path.join(os.path.dirname(__file__), '../mlforge')))
+import json
+import os
 
-from mlforge.mlforge import Pipeline, Stage
+from mlforge.mlforge import Pipeline, Stage, _cache_path, _config_digest
 
 
 class HostClass:
@@ -141,3 +139,88 @@ class Test_ProcessConfig:
 
         assert isinstance(steps, list)
         assert len(steps) == 0
+
+
+class Test_FromConfig:
+    """
+    Test `Pipeline.from_config()` end to end, including the stage cache:
+    the first load parses the YAML and writes the sidecar, the second one
+    must reconstruct identical stages from it.
+    """
+
+    yaml_config = (
+        "step1:\n"
+        "  method: host_method\n"
+        "  arguments:\n"
+        "    param1: Hello\n"
+        "    param2: [1, 2, 3]\n"
+    )
+
+    def test_cached_load_matches_cold_load(self, tmp_path):
+        config_file = str(tmp_path / "pipeline.yaml")
+        with open(config_file, 'w', encoding='utf-8') as f:
+            f.write(self.yaml_config)
+
+        cold = Pipeline(HostClass(), prog_bar=False)
+        cold.from_config(config_file)
+        assert os.path.exists(_cache_path(config_file))
+
+        warm = Pipeline(HostClass(), prog_bar=False)
+        warm.from_config(config_file)
+
+        assert len(warm.pipeline) == len(cold.pipeline) == 1
+        cold_args = cold.pipeline[0].arguments
+        warm_args = warm.pipeline[0].arguments
+        assert warm_args == cold_args
+        assert type(warm_args) is type(cold_args)
+        assert dict(warm_args) == {'param1': 'Hello', 'param2': (1, 2, 3)}
+
+    def test_malformed_cache_degrades_to_reparse(self, tmp_path):
+        config_file = str(tmp_path / "pipeline.yaml")
+        with open(config_file, 'w', encoding='utf-8') as f:
+            f.write(self.yaml_config)
+
+        # Valid JSON of the wrong shape must not crash from_config.
+        for payload in ([1, 2, 3],
+                        {'hash': _config_digest(config_file),
+                         'stages': [{}]}):
+            with open(_cache_path(config_file), 'w', encoding='utf-8') as f:
+                json.dump(payload, f)
+
+            pipeline = Pipeline(HostClass(), prog_bar=False)
+            pipeline.from_config(config_file)
+            assert len(pipeline.pipeline) == 1
+            assert dict(pipeline.pipeline[0].arguments) == \
+                {'param1': 'Hello', 'param2': (1, 2, 3)}
+
+    def test_show_lists_frozen_arguments_per_key(self, tmp_path, capsys):
+        config_file = str(tmp_path / "pipeline.yaml")
+        with open(config_file, 'w', encoding='utf-8') as f:
+            f.write(self.yaml_config)
+
+        pipeline = Pipeline(HostClass(), prog_bar=False)
+        pipeline.from_config(config_file)
+        pipeline.show()
+
+        output = capsys.readouterr().out
+        assert "- param1: Hello" in output
+        assert "- param2: (1, 2, 3)" in output
+
+    def test_non_string_argument_keys_are_not_cached(self, tmp_path):
+        config_file = str(tmp_path / "pipeline.yaml")
+        with open(config_file, 'w', encoding='utf-8') as f:
+            f.write(
+                "step1:\n"
+                "  method: host_method\n"
+                "  arguments: {0: cat, 1: dog}\n")
+
+        cold = Pipeline(HostClass(), prog_bar=False)
+        cold.from_config(config_file)
+        # json would stringify the integer keys, so no sidecar is written
+        # and the second load re-reads the config with the keys intact.
+        assert not os.path.exists(_cache_path(config_file))
+
+        warm = Pipeline(HostClass(), prog_bar=False)
+        warm.from_config(config_file)
+        assert dict(warm.pipeline[0].arguments) == {0: 'cat', 1: 'dog'}
+        assert warm.pipeline[0].arguments == cold.pipeline[0].arguments
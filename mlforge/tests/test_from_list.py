@@ -14,13 +14,9 @@ Test the from_list method of the Pipeline class.
 # pylint: disable=missing-function-docstring
 # pylint: disable=W0212:protected-access, C0413:wrong-import-position
 
-import os
-import sys
 
 import pytest
 
-sys.path.insert(0, os.path.abspath(
-    os.path.join(os.path.dirname(__file__), '../mlforge')))
 
 from mlforge.mlforge import Pipeline, Stage
 
@@ -31,8 +27,6 @@ class HostClass:
         self.host_param2 = param2
 
     def host_method(self, param1=None, param2=None):
-        print(f"  > Calling the method \'my_method()\'\n"
-              f"    > I got params: param1={param1}, param2={param2}")
         self.host_param1 = param1
         self.host_param2 = param2
         return f"host_method({param1}, {param2})"
@@ -42,14 +36,10 @@ class SampleClass:
     def __init__(self, param1=None, param2=False):
         self.class_param1 = param1
         self.class_param2 = param2
-        print(f"  > Called the init of class {self.__class__}\n"
-              f"    > I got params: {self.class_param1}, {self.class_param2}")
 
     def class_method(self, param1=None, param2=None):
         self.class_param1 = param1
         self.class_param2 = param2
-        print(
-            f"  > Called static method \'{SampleClass.method.__name__}\'")
         return "Hi"
 
 
@@ -11,12 +11,8 @@ Tests for the parse_step method.
 # pylint: disable=W0106:expression-not-assigned, R1702:too-many-branches
 # pylint: disable=C0413:wrong-import-position
 
-import os
-import sys
 import pytest
 
-sys.path.insert(0, os.path.abspath(
-    os.path.join(os.path.dirname(__file__), '../mlforge')))
 
 from mlforge.mlforge import Pipeline
 
@@ -12,37 +12,45 @@ Tests for the progress bar functionality in the Pipeline class.
 # pylint: disable=missing-function-docstring
 # pylint: disable=W0212:protected-access, C0413:import-misplaced
 
-import os
-import sys
 
-sys.path.insert(0, os.path.abspath(
-    os.path.join(os.path.dirname(__file__), '../mlforge')))
+import pytest
 
 from mlforge.mlforge import Pipeline
 
 
+# A single Pipeline is shared by the whole module and reset between tests,
+# instead of paying construction and teardown once per test.
+@pytest.fixture(scope="module")
+def pipeline_factory():
+    pipeline = Pipeline()
+
+    def factory():
+        pipeline._reset()
+        return pipeline
+
+    yield factory
+    pipeline.close()
+
+
 class Test_PbarUpdate:
 
     # Creates a progress bar with the total number of steps in the pipeline.
-    def test_progress_bar_creation(self):
-        pipeline = Pipeline()
+    def test_progress_bar_creation(self, pipeline_factory):
+        pipeline = pipeline_factory()
         pipeline.pipeline = [1, 2, 3, 4, 5]
         pipeline._pbar_create("main", len(pipeline.pipeline))
         assert pipeline.pbar.progress._tasks[0].total == len(pipeline.pipeline)
-        pipeline.close()
 
     # The pipeline has no steps, so the progress bar is not created.
-    def test_no_progress_bar_creation(self):
-        pipeline = Pipeline()
+    def test_no_progress_bar_creation(self, pipeline_factory):
+        pipeline = pipeline_factory()
         pipeline._pbar_create("main", len(pipeline.pipeline))
         assert pipeline.pbar is None
-        pipeline.close()
 
     # Can update the progress bar by a step of 1
-    def test_update_progress_bar_by_step_of_1(self):
-        pipeline = Pipeline()
+    def test_update_progress_bar_by_step_of_1(self, pipeline_factory):
+        pipeline = pipeline_factory()
         pipeline.pipeline = [1, 2, 3, 4, 5]
         pipeline._pbar_create("main", len(pipeline.pipeline))
         pipeline._pbar_update("main", 1)
         assert pipeline.pbar.progress._tasks[0].completed == 1
-        pipeline.close()
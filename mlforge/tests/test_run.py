@@ -12,15 +12,10 @@ Tests for the RUN method.
 # pylint: disable=W0612:unused-variable, E0602:undefined-variable
 # pylint: disable=C0413:wrong-import-position
 
-import os
-import sys
 
 import pytest
 
 
-sys.path.insert(0, os.path.abspath(
-    os.path.join(os.path.dirname(__file__), '../mlforge')))
-
 from mlforge.mlforge import Pipeline
 
 
@@ -43,31 +38,45 @@ class SampleClass:
         return 1
 
 
+# A single Pipeline is shared by the whole module; each test gets it reset
+# and rebound to its own host instead of constructing a fresh instance.
+@pytest.fixture(scope="module")
+def pipeline_factory():
+    pipeline = Pipeline()
+
+    def factory(host=None, description=None, prog_bar=True):
+        pipeline._reset(
+            host=host, description=description, prog_bar=prog_bar)
+        return pipeline
+
+    yield factory
+    pipeline.close()
+
+
 class TestRun:
 
     # Runs the pipeline successfully with non-empty list of steps.
-    def test_runs_pipeline_successfully(self):
+    def test_runs_pipeline_successfully(self, pipeline_factory):
         host_object = HostClass()
-        pipeline = Pipeline(host=host_object, description="main")
+        pipeline = pipeline_factory(host=host_object, description="main")
         pipeline.from_list([
             ('function1'),
             ('function2'),
             ('function3')
         ])
         pipeline.run()
-        pipeline.close()
 
     # Raises an assertion error if the pipeline is empty.
-    def test_raises_assertion_error_if_pipeline_empty(self):
-        pipeline = Pipeline()
+    def test_raises_assertion_error_if_pipeline_empty(self, pipeline_factory):
+        pipeline = pipeline_factory()
         with pytest.raises(AssertionError):
             pipeline.run()
-        pipeline.close()
 
     # Run a pipeline created with no host, and a single step that returns an attribute.
     # Check that the return value is in globals.
-    def test_pipeline_with_no_host_and_single_step_returns_attribute(self):
-        pipeline = Pipeline()
+    def test_pipeline_with_no_host_and_single_step_returns_attribute(
+            self, pipeline_factory):
+        pipeline = pipeline_factory()
         pipeline.from_list([
             ('obj', SampleClass),
             ('attribute_name', 'obj.method')
@@ -75,18 +84,17 @@ class TestRun:
         pipeline.run()
         assert 'attribute_name' in pipeline.attributes_
         assert pipeline.get_attribute('attribute_name') == 1
-        pipeline.close()
 
     # Create a pipeline with a host object and a simple stage in the pipeline that
     # returns an attribute. check that the attribute is in the host object.
-    def test_pipeline_with_host_object(self):
+    def test_pipeline_with_host_object(self, pipeline_factory):
         # Create a host object
         class Host:
             pass
         host = Host()
 
         # Create a pipeline
-        pipeline = Pipeline(host=host, prog_bar=False)
+        pipeline = pipeline_factory(host=host, prog_bar=False)
         pipeline.from_list([
             ('attribute_name', 'method', SampleClass)
         ])
@@ -96,4 +104,18 @@ class TestRun:
 
         # Check if the attribute is in the host object
         assert hasattr(host, 'attribute_name')
+
+    # A closed pipeline can be reset and run again.
+    def test_reset_after_close_allows_reuse(self):
+        host = HostClass()
+        pipeline = Pipeline(host=host, prog_bar=False)
+        pipeline.from_list([('out', 'method')])
+        pipeline.run()
+        pipeline.close()
+
+        reused_host = HostClass()
+        pipeline._reset(host=reused_host, prog_bar=False)
+        pipeline.from_list([('out', 'method')])
+        pipeline.run()
+        assert reused_host.out == 1
         pipeline.close()
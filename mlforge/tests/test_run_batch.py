@@ -0,0 +1,85 @@
+"""
+
+Tests for the run_batch method of the Pipeline class.
+
+"""
+# pylint: disable=C0116:missing-function-docstring, C0115:missing-class-docstring
+# pylint: disable=W0212:protected-access
+
+import pytest
+
+from mlforge.mlforge import Pipeline
+
+
+class HostClass:
+    def __init__(self, value=1):
+        self.value = value
+
+    def work(self):
+        return self.value
+
+
+class FailingHost:
+    def work(self):
+        raise RuntimeError("boom")
+
+
+class SampleClass:
+    @staticmethod
+    def method():
+        return 1
+
+
+class Test_RunBatch:
+
+    # Runs the same pipeline once per host and snapshots each host's results.
+    def test_run_batch_multiple_hosts(self):
+        original = HostClass(0)
+        pipeline = Pipeline(host=original, prog_bar=False)
+        pipeline.from_list([('out', 'work')])
+
+        hosts = [HostClass(1), HostClass(2), HostClass(3)]
+        results = pipeline.run_batch(hosts)
+
+        assert results == [{'out': 1}, {'out': 2}, {'out': 3}]
+        for host, expected in zip(hosts, [1, 2, 3]):
+            assert host.out == expected
+
+    # host=None entries are snapshotted from the pipeline's attributes_.
+    def test_run_batch_none_host(self):
+        pipeline = Pipeline(prog_bar=False)
+        pipeline.from_list([
+            ('obj', SampleClass),
+            ('value', 'obj.method')
+        ])
+
+        results = pipeline.run_batch([None, None])
+
+        assert len(results) == 2
+        assert results[0]['value'] == 1
+        assert results[1]['value'] == 1
+
+    # The original host binding and compiled state survive the batch.
+    def test_run_batch_restores_original_host(self):
+        original = HostClass(7)
+        pipeline = Pipeline(host=original, prog_bar=False)
+        pipeline.from_list([('out', 'work')])
+
+        pipeline.run_batch([HostClass(1), HostClass(2)])
+
+        assert pipeline.host is original
+        pipeline.run()
+        assert original.out == 7
+
+    # A run that raises still restores the original binding (finally path).
+    def test_run_batch_raising_run_restores_original_host(self):
+        original = HostClass(7)
+        pipeline = Pipeline(host=original, prog_bar=False)
+        pipeline.from_list([('out', 'work')])
+
+        with pytest.raises(RuntimeError, match="boom"):
+            pipeline.run_batch([FailingHost()])
+
+        assert pipeline.host is original
+        pipeline.run()
+        assert original.out == 7
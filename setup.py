@@ -26,7 +26,7 @@ setuptools.setup(
     # package_dir={"": "mlforge"},
     # packages=setuptools.find_packages(where="mlforge"),
     packages=setuptools.find_packages(),
-    python_requires=">=3.6"
+    python_requires=">=3.10"
 )
 
 EXTRAS_REQUIRE = {